@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+import pytest
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--use-requests-cache",
+        action="store_true",
+        default=False,
+        help="Cache GET responses of the server in .cache/requests-cache.sqlite for 12 hours, "
+             "useful for local iterations on tests. Requires `requests-cache`",
+    )
+
+
+def pytest_configure(config: pytest.Config):
+    if not config.getoption("--use-requests-cache"):
+        return
+
+    import requests_cache
+
+    from openapi_integration.helpers import helpers
+
+    helpers._SESSION = helpers.configure_session(requests_cache.CachedSession(
+        ".cache/requests-cache.sqlite",
+        expire_after=timedelta(hours=12),
+        allowable_methods=["GET"],
+        # Collections are created and changed by the tests themselves, their state must never be stale
+        urls_expire_after={"*/collections*": requests_cache.DO_NOT_CACHE},
+    ))
@@ -0,0 +1,36 @@
+"""
+Test modules use their own collections, so the suite can be distributed over pytest-xdist workers:
+
+    pytest -n auto --dist=loadfile \
+        --ignore=openapi_integration/test_db_lock.py --ignore=openapi_integration/test_snapshot.py
+    pytest openapi_integration/test_db_lock.py openapi_integration/test_snapshot.py
+
+`--dist=loadfile` keeps the tests of a module, which share a collection, on the same worker.
+`test_db_lock.py` locks writes on the whole server and `test_snapshot.py` checks full storage snapshots,
+so they have to run alone.
+"""
+import pytest
+
+from .helpers.collection_setup import basic_collection_setup, upsert_basic_points
+from .helpers.helpers import request_with_validation
+
+# Not made unique per worker: the collection outlives the run, a per-worker name would leave
+# another copy on the server for every worker that happened to use it
+shared_collection_name = 'test_collection_shared'
+
+
+@pytest.fixture(scope='session')
+def shared_collection():
+    # Populated collection for read-only tests which only need some data to exist on the server.
+    # It is not dropped, so consecutive local runs against the same server can reuse it
+    response = request_with_validation(
+        api='/collections/{collection_name}',
+        method="GET",
+        path_params={'collection_name': shared_collection_name},
+    )
+    if response.ok:
+        # Still upsert, tests probe that points were upserted since the server started
+        upsert_basic_points(collection_name=shared_collection_name, wait=False)
+    else:
+        basic_collection_setup(collection_name=shared_collection_name, wait=False)
+    return shared_collection_name
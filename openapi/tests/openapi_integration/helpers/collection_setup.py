@@ -1,49 +1,15 @@
-from .helpers import request_with_validation
+import functools
 
+from .helpers import req, serialize_body
 
-def drop_collection(collection_name='test_collection'):
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-
-def basic_collection_setup(collection_name='test_collection', on_disk_payload=False):
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name},
-        body={
-            "vectors": {
-                "size": 4,
-                "distance": "Dot"
-            },
-            "on_disk_payload": on_disk_payload
-        }
-    )
-    assert response.ok
 
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="GET",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-    response = request_with_validation(
+# Validated and serialized on first use rather than at import, which would load the whole spec during
+# collection. The same points are inserted by every setup
+@functools.lru_cache(maxsize=1)
+def _basic_points_body() -> bytes:
+    return serialize_body(
         api='/collections/{collection_name}/points',
         method="PUT",
-        path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
         body={
             "points": [
                 {
@@ -88,49 +54,13 @@ def basic_collection_setup(collection_name='test_collection', on_disk_payload=Fa
             ]
         }
     )
-    assert response.ok
 
 
-def multivec_collection_setup(collection_name='test_collection', on_disk_payload=False):
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name},
-        body={
-            "vectors": {
-                "image": {
-                    "size": 4,
-                    "distance": "Dot"
-                },
-                "text": {
-                    "size": 8,
-                    "distance": "Cosine"
-                }
-            },
-            "on_disk_payload": on_disk_payload
-        }
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="GET",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-    response = request_with_validation(
+@functools.lru_cache(maxsize=1)
+def _multivec_points_body() -> bytes:
+    return serialize_body(
         api='/collections/{collection_name}/points',
         method="PUT",
-        path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
         body={
             "points": [
                 {
@@ -183,4 +113,79 @@ def multivec_collection_setup(collection_name='test_collection', on_disk_payload
             ]
         }
     )
-    assert response.ok
+
+
+def drop_collection(collection_name='test_collection'):
+    req(
+        api='/collections/{collection_name}',
+        method="DELETE",
+        path_params={'collection_name': collection_name},
+    )
+
+
+def basic_collection_setup(collection_name='test_collection', on_disk_payload=False, wait=True):
+    req(
+        api='/collections/{collection_name}',
+        method="DELETE",
+        path_params={'collection_name': collection_name},
+    )
+
+    req(
+        api='/collections/{collection_name}',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        body={
+            "vectors": {
+                "size": 4,
+                "distance": "Dot"
+            },
+            "on_disk_payload": on_disk_payload
+        }
+    )
+
+    upsert_basic_points(collection_name=collection_name, wait=wait)
+
+
+def upsert_basic_points(collection_name='test_collection', wait=True):
+    req(
+        api='/collections/{collection_name}/points',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true' if wait else 'false'},
+        raw_body=_basic_points_body()
+    )
+
+
+def multivec_collection_setup(collection_name='test_collection', on_disk_payload=False, wait=True):
+    req(
+        api='/collections/{collection_name}',
+        method="DELETE",
+        path_params={'collection_name': collection_name},
+    )
+
+    req(
+        api='/collections/{collection_name}',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        body={
+            "vectors": {
+                "image": {
+                    "size": 4,
+                    "distance": "Dot"
+                },
+                "text": {
+                    "size": 8,
+                    "distance": "Cosine"
+                }
+            },
+            "on_disk_payload": on_disk_payload
+        }
+    )
+
+    req(
+        api='/collections/{collection_name}/points',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true' if wait else 'false'},
+        raw_body=_multivec_points_body()
+    )
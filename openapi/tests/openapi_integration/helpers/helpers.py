@@ -1,10 +1,58 @@
+import atexit
+import contextlib
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
 import jsonschema
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from schemathesis.models import APIOperation
 from schemathesis.specs.openapi.references import ConvertingResolver
 from schemathesis.specs.openapi.schemas import OpenApi30
 
-from .settings import QDRANT_HOST, SCHEMA
+from .settings import QDRANT_HOST, REQUEST_TIMEOUT_SEC, SKIP_RESPONSE_VALIDATION, XDIST_WORKER, get_schema
+
+# Shared between calls, so concurrent requests do not pay thread startup every time
+_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+# Requests queued by `req` inside of a `request_batch` block
+_REQUEST_BATCH: ContextVar[Optional[list]] = ContextVar('_REQUEST_BATCH', default=None)
+# Cached validators share a ref resolver, which keeps a mutable scope stack
+_VALIDATION_LOCK = threading.Lock()
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """
+    Fill in a default timeout for requests sent without one
+    """
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=REQUEST_TIMEOUT_SEC if timeout is None else timeout, **kwargs)
+
+
+def configure_session(session: requests.Session) -> requests.Session:
+    """
+    Pool enough connections for concurrent requests, and never wait for the server without a timeout
+    """
+    session.mount("http://", _TimeoutHTTPAdapter(pool_connections=4, pool_maxsize=16, pool_block=False))
+    atexit.register(session.close)
+    return session
+
+
+_SESSION = configure_session(requests.Session())
+
+
+def worker_collection_name(collection_name: str) -> str:
+    """
+    Make collection names unique per pytest-xdist worker, so test modules can run in parallel
+    Outside of xdist the name is returned as is
+    """
+    if XDIST_WORKER:
+        return f"{collection_name}_{XDIST_WORKER}"
+    return collection_name
 
 
 def get_api_string(host, api, path_params):
@@ -12,23 +60,61 @@ def get_api_string(host, api, path_params):
     >>> get_api_string('http://localhost:6333', '/collections/{name}', {'name': 'hello', 'a': 'b'})
     'http://localhost:6333/collections/hello'
     """
-    return f"{host}{api}".format(**path_params)
+    return _format_api_string(host, api, tuple(sorted(path_params.items())))
+
+
+@functools.lru_cache(maxsize=256)
+def _format_api_string(host, api, frozen_path_params: tuple) -> str:
+    # The same api and path params are requested over and over by tests and setups
+    return f"{host}{api}".format(**dict(frozen_path_params))
 
 
-def validate_schema(data, operation_schema: OpenApi30, raw_definitions):
+@functools.lru_cache(maxsize=256)
+def get_request_body_validator(api: str, method: str) -> jsonschema.Draft7Validator:
     """
-    :param data: concrete values to validate
-    :param operation_schema: operation schema
-    :param raw_definitions: definitions to check data with
-    :return:
+    Build the request body validator of an operation once, checking and resolving the schema is expensive
+
+    :param api: api path template, as in the spec
+    :param method: http method of the operation
+    :return: validator of the operation request body
     """
+    operation: APIOperation = get_schema()[api][method]
+    operation_schema: OpenApi30 = operation.schema
+    raw_definitions = operation.definition.raw['requestBody']['content']['application/json']['schema']
     resolver = ConvertingResolver(
         operation_schema.location or "",
         operation_schema.raw_schema,
         nullable_name=operation_schema.nullable_name,
         is_response_schema=False
     )
-    jsonschema.validate(data, raw_definitions, cls=jsonschema.Draft7Validator, resolver=resolver)
+    jsonschema.Draft7Validator.check_schema(raw_definitions)
+    return jsonschema.Draft7Validator(raw_definitions, resolver=resolver)
+
+
+def validate_schema(data, api: str, method: str):
+    """
+    :param data: concrete values to validate
+    :param api: api path template of the operation
+    :param method: http method of the operation
+    :return:
+    """
+    with _VALIDATION_LOCK:
+        error = jsonschema.exceptions.best_match(get_request_body_validator(api, method).iter_errors(data))
+    if error is not None:
+        raise error
+
+
+def serialize_body(api: str, method: str, body: dict) -> bytes:
+    """
+    Validate a request body once and serialize it, to send the same body repeatedly as `raw_body`
+
+    :param api: api path template, as in the spec
+    :param method: http method of the operation
+    :param body: request body
+    :return: json encoded body
+    """
+    validate_schema(data=body, api=api, method=method)
+    return orjson.dumps(body)
 
 
 def request_with_validation(
@@ -36,24 +122,24 @@ def request_with_validation(
         method: str,
         path_params: dict = None,
         query_params: dict = None,
-        body: dict = None
+        body: dict = None,
+        raw_body: bytes = None
 ) -> requests.Response:
-    operation: APIOperation = SCHEMA[api][method]
+    """
+    :param raw_body: json body serialized by `serialize_body`, sent as is instead of `body`
+    """
+    operation: APIOperation = get_schema()[api][method]
 
     assert isinstance(operation.schema, OpenApi30)
 
     if body:
-        validate_schema(
-            data=body,
-            operation_schema=operation.schema,
-            raw_definitions=operation.definition.raw['requestBody']['content']['application/json']['schema']
-        )
+        validate_schema(data=body, api=api, method=method)
 
     if path_params is None:
         path_params = {}
     if query_params is None:
         query_params = {}
-    action = getattr(requests, method.lower(), None)
+    action = getattr(_SESSION, method.lower(), None)
 
     for param in operation.path_parameters.items:
         if param.is_required:
@@ -72,12 +158,83 @@ def request_with_validation(
     if not action:
         raise RuntimeError(f"Method {method} does not exists")
 
-    response = action(
-        url=get_api_string(QDRANT_HOST, api, path_params),
-        params=query_params,
-        json=body
-    )
+    if raw_body is not None:
+        response = action(
+            url=get_api_string(QDRANT_HOST, api, path_params),
+            params=query_params,
+            data=raw_body,
+            headers={'content-type': 'application/json'},
+            timeout=REQUEST_TIMEOUT_SEC,
+        )
+    else:
+        response = action(
+            url=get_api_string(QDRANT_HOST, api, path_params),
+            params=query_params,
+            json=body,
+            timeout=REQUEST_TIMEOUT_SEC,
+        )
+
+    if not response.ok:
+        # A connection which served an error response is not reused, the server may not answer on it anymore
+        _SESSION.get_adapter(response.url).close()
 
-    operation.validate_response(response)
+    if not SKIP_RESPONSE_VALIDATION:
+        operation.validate_response(response)
 
     return response
+
+
+def request_concurrently(*requests_kwargs: dict) -> List[requests.Response]:
+    """
+    Issue independent requests at the same time.
+
+    :param requests_kwargs: keyword arguments of `request_with_validation`, one dict per request
+    :return: responses in the same order as the requests
+    """
+    futures = [_EXECUTOR.submit(request_with_validation, **kwargs) for kwargs in requests_kwargs]
+    return [future.result() for future in futures]
+
+
+def _response_json(response: requests.Response) -> dict:
+    assert response.ok, response.text
+    return response.json()
+
+
+def req(api: str, method: str, **kwargs) -> Optional[dict]:
+    """
+    Send a validated request and return its json body, asserting that the request succeeded
+
+    Inside of a `request_batch` block the request is only queued, and `None` is returned
+
+    :param api: api path template, as in the spec
+    :param method: http method of the operation
+    :param kwargs: other arguments of `request_with_validation`
+    :return: json body of the response
+    """
+    batch = _REQUEST_BATCH.get()
+    if batch is not None:
+        batch.append(dict(api=api, method=method, **kwargs))
+        return None
+    return _response_json(request_with_validation(api=api, method=method, **kwargs))
+
+
+@contextlib.contextmanager
+def request_batch() -> Iterator[List[dict]]:
+    """
+    Queue the `req` calls of the block and send them concurrently when the block exits
+
+        with request_batch() as results:
+            req(api='/collections', method="GET")
+            req(api='/telemetry', method="GET")
+        collections, telemetry = results
+
+    :return: list which is filled with json bodies of the queued requests, in order, when the block exits
+    """
+    queued = []
+    results = []
+    token = _REQUEST_BATCH.set(queued)
+    try:
+        yield results
+    finally:
+        _REQUEST_BATCH.reset(token)
+    results.extend(_response_json(response) for response in request_concurrently(*queued))
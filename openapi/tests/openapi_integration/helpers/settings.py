@@ -1,9 +1,53 @@
+import functools
 import os
+import pickle
+from pathlib import Path
 
+import orjson
 import schemathesis
+import yaml
+from schemathesis.specs.openapi.schemas import BaseOpenAPISchema
+from schemathesis.utils import StringDatesYAMLLoader
 
 ROOT_DIR = os.path.dirname(__file__)
 OPENAPI_FILE = os.environ.get("OPENAPI_FILE", os.path.join(os.path.dirname(ROOT_DIR), '../..', 'openapi-merged.yaml'))
+# Parsed YAML specs are kept here between runs and pytest-xdist workers
+CACHE_DIR = Path(ROOT_DIR).parent.parent / '.cache'
 
-SCHEMA = schemathesis.from_file(open(OPENAPI_FILE))
 QDRANT_HOST = os.environ.get("QDRANT_HOST", "http://localhost:6333")
+# Seconds to wait for the server, a stuck connection must fail the test instead of hanging the whole run
+REQUEST_TIMEOUT_SEC = 30
+# Name of the pytest-xdist worker, e.g. `gw0`, empty if tests are not distributed
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "")
+
+# Response validation dominates the time of small requests, allow to disable it for quick runs
+SKIP_RESPONSE_VALIDATION = os.environ.get("QDRANT_SKIP_VALIDATION", "0") == "1"
+
+
+def _load_raw_spec(spec_path: Path) -> dict:
+    if spec_path.suffix == '.json':
+        return orjson.loads(spec_path.read_bytes())
+
+    cache_file = CACHE_DIR / f"{spec_path.name}.{spec_path.stat().st_mtime_ns}.pkl"
+    if cache_file.exists():
+        with cache_file.open('rb') as f:
+            return pickle.load(f)
+
+    raw = yaml.load(spec_path.read_text(), StringDatesYAMLLoader)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    # pytest-xdist workers may write the cache at the same time, only publish complete files
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_file.open('wb') as f:
+        pickle.dump(raw, f)
+    os.replace(tmp_file, cache_file)
+    return raw
+
+
+@functools.cache
+def get_schema() -> BaseOpenAPISchema:
+    """
+    Load the OpenAPI spec on first use
+
+    `schemathesis.from_file` parses JSON specs with the YAML parser too, which is slow for the whole spec
+    """
+    return schemathesis.from_dict(_load_raw_spec(Path(OPENAPI_FILE)))
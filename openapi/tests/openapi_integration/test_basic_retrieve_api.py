@@ -1,31 +1,37 @@
 import pytest
 
-from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.collection_setup import basic_collection_setup, drop_collection, upsert_basic_points
+from .helpers.helpers import req, request_batch, worker_collection_name
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture(scope='module', autouse=True)
 def setup():
     basic_collection_setup(collection_name=collection_name)
     yield
     drop_collection(collection_name=collection_name)
 
 
+@pytest.fixture
+def restore_collection():
+    yield
+    # Mutating tests only overwrite some of the initial points, upserting them again brings them back
+    upsert_basic_points(collection_name=collection_name)
+
+
 def test_points_retrieve():
     points_retrieve()
 
 
 def points_retrieve():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 2},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -33,18 +39,16 @@ def points_retrieve():
             "ids": [1, 2]
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 2
+    assert len(response['result']) == 2
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['vectors_count'] == 8
+    assert response['result']['vectors_count'] == 8
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -53,10 +57,9 @@ def points_retrieve():
             "limit": 3
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 3
+    assert len(response['result']) == 3
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -75,18 +78,16 @@ def points_retrieve():
             "limit": 3
         }
     )
-    assert response.ok
     # only 2 London records in collection
-    assert len(response.json()['result']) == 2
+    assert len(response['result']) == 2
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
         body={"offset": 2, "limit": 2, "with_vector": True}
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 2
+    assert len(response['result']['points']) == 2
 
 
 def test_exclude_payload():
@@ -94,7 +95,7 @@ def test_exclude_payload():
 
 
 def exclude_payload():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -116,9 +117,8 @@ def exclude_payload():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) > 0
-    for result in response.json()['result']:
+    assert len(response['result']) > 0
+    for result in response['result']:
         assert 'city' not in result['payload']
 
 
@@ -127,7 +127,7 @@ def test_is_empty_condition():
 
 
 def is_empty_condition():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -147,12 +147,9 @@ def is_empty_condition():
         }
     )
 
-    assert response.ok
+    assert len(response['result']) == 4
 
-    json = response.json()
-    assert len(json['result']) == 4
-
-    ids = [x['id'] for x in json['result']]
+    ids = [x['id'] for x in response['result']]
     assert 5 in ids
     assert 6 in ids
     assert 7 in ids
@@ -164,7 +161,7 @@ def test_is_null_condition():
 
 
 def is_null_condition():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -183,12 +180,10 @@ def is_null_condition():
             "with_payload": True
         }
     )
-    assert response.ok
 
-    json = response.json()
-    assert len(json['result']) == 1
+    assert len(response['result']) == 1
 
-    ids = [x['id'] for x in json['result']]
+    ids = [x['id'] for x in response['result']]
     assert 7 in ids
 
 
@@ -197,7 +192,7 @@ def test_recommendation():
 
 
 def recommendation():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -209,17 +204,16 @@ def recommendation():
             "with_payload": True
         }
     )
-    assert len(response.json()['result']) == 3
-    assert response.json()['result'][0]['payload'] is not None
-    assert response.ok
+    assert len(response['result']) == 3
+    assert response['result'][0]['payload'] is not None
 
 
-def test_query_nested():
+def test_query_nested(restore_collection):
     query_nested()
 
 
 def query_nested():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -239,9 +233,8 @@ def query_nested():
             ]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -261,15 +254,14 @@ def query_nested():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
+    assert len(response['result']['points']) == 1
 
 
-def test_with_vectors_alias_of_with_vector():
+def test_with_vectors_alias_of_with_vector(restore_collection):
     database_id = "8594ff5d-265f-adfh-a9f5-b3b4b9665506"
     vector = [0.15, 0.31, 0.76, 0.74]
     
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -286,10 +278,9 @@ def test_with_vectors_alias_of_with_vector():
             ]
         }
     )
-    assert response.ok
         
     def scroll_with_vector(keyword):
-        response = request_with_validation(
+        req(
             api='/collections/{collection_name}/points/scroll',
             method='POST',
             path_params={'collection_name': collection_name},
@@ -308,11 +299,11 @@ def test_with_vectors_alias_of_with_vector():
                 "limit": 1,
             }
         )
-        
-        assert response.ok
-        body = response.json()
-        
-        assert body["result"]["points"][0]["vector"] == vector
-        
-    scroll_with_vector("with_vector")
-    scroll_with_vector("with_vectors")
\ No newline at end of file
+
+    # Both scrolls are independent, send them at the same time
+    with request_batch() as responses:
+        scroll_with_vector("with_vector")
+        scroll_with_vector("with_vectors")
+
+    for response in responses:
+        assert response["result"]["points"][0]["vector"] == vector
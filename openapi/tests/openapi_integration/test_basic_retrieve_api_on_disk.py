@@ -1,11 +1,11 @@
 import pytest
 
 from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import worker_collection_name
 from .test_basic_retrieve_api import points_retrieve, exclude_payload, is_empty_condition, \
     recommendation, query_nested
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
 @pytest.fixture(autouse=True)
@@ -1,9 +1,9 @@
 import pytest
 
 from .helpers.collection_setup import drop_collection, multivec_collection_setup
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
 @pytest.fixture(autouse=True)
@@ -18,14 +18,13 @@ def test_points_retrieve():
 
 
 def points_retrieve():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 2},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -33,18 +32,16 @@ def points_retrieve():
             "ids": [1, 2]
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 2
+    assert len(response['result']) == 2
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['vectors_count'] == 12
+    assert response['result']['vectors_count'] == 12
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -53,10 +50,9 @@ def points_retrieve():
             "limit": 3
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 3
+    assert len(response['result']) == 3
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -78,18 +74,16 @@ def points_retrieve():
             "limit": 3
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 2  # only 2 London records in collection
+    assert len(response['result']) == 2  # only 2 London records in collection
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
         body={"offset": 2, "limit": 2, "with_vector": True}
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 2
-    for point in response.json()['result']['points']:
+    assert len(response['result']['points']) == 2
+    for point in response['result']['points']:
         assert point['vector'] is not None
         assert len(point['vector']['text']) == 8
         assert len(point['vector']['image']) == 4
@@ -100,7 +94,7 @@ def test_exclude_payload():
 
 
 def exclude_payload():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -122,9 +116,8 @@ def exclude_payload():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) > 0
-    for result in response.json()['result']:
+    assert len(response['result']) > 0
+    for result in response['result']:
         assert 'city' not in result['payload']
 
 
@@ -133,7 +126,7 @@ def test_is_empty_condition():
 
 
 def is_empty_condition():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -153,10 +146,9 @@ def is_empty_condition():
         }
     )
 
-    assert len(response.json()['result']) == 2
-    for result in response.json()['result']:
+    assert len(response['result']) == 2
+    for result in response['result']:
         assert "city" not in result['payload']
-    assert response.ok
 
 
 def test_recommendation():
@@ -164,7 +156,7 @@ def test_recommendation():
 
 
 def recommendation():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/recommend',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -177,9 +169,8 @@ def recommendation():
             "using": "image"
         }
     )
-    assert len(response.json()['result']) == 3
-    assert response.json()['result'][0]['payload'] is not None
-    assert response.ok
+    assert len(response['result']) == 3
+    assert response['result'][0]['payload'] is not None
 
 
 def test_query_nested():
@@ -187,7 +178,7 @@ def test_query_nested():
 
 
 def query_nested():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -210,9 +201,8 @@ def query_nested():
             ]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -232,7 +222,6 @@ def query_nested():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
-    assert 'text' in response.json()['result']['points'][0]['vector']
-    assert len(response.json()['result']['points'][0]['vector']) == 1
+    assert len(response['result']['points']) == 1
+    assert 'text' in response['result']['points'][0]['vector']
+    assert len(response['result']['points'][0]['vector']) == 1
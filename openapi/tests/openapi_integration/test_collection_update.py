@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_uuid'
+collection_name = worker_collection_name('test_collection_uuid')
 
 
 @pytest.fixture(autouse=True)
@@ -14,7 +14,7 @@ def setup():
 
 
 def test_collection_update():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="PATCH",
         path_params={'collection_name': collection_name},
@@ -25,9 +25,8 @@ def test_collection_update():
             }
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -42,11 +41,9 @@ def test_collection_update():
             ]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 7},
     )
-    assert response.ok
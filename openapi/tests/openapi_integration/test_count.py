@@ -1,9 +1,9 @@
 import pytest
 
 from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 
-collection_name = 'test_collection_threshold'
+collection_name = worker_collection_name('test_collection_threshold')
 
 
 @pytest.fixture(autouse=True)
@@ -14,7 +14,7 @@ def setup():
 
 
 def test_exact_count_search():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/count',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -37,12 +37,11 @@ def test_exact_count_search():
             }
         }
     )
-    assert response.ok
-    assert response.json()['result']['count'] == 4
+    assert response['result']['count'] == 4
 
 
 def test_approx_count_search():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/count',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -66,6 +65,5 @@ def test_approx_count_search():
             "exact": False
         }
     )
-    assert response.ok
-    assert response.json()['result']['count'] < 8
-    assert response.json()['result']['count'] > 0
+    assert response['result']['count'] < 8
+    assert response['result']['count'] > 0
@@ -1,9 +1,9 @@
 import pytest
 
 from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import request_with_validation, worker_collection_name
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
 @pytest.fixture(autouse=True)
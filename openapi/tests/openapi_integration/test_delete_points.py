@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_delete'
+collection_name = worker_collection_name('test_collection_delete')
 
 
 @pytest.fixture(autouse=True)
@@ -15,7 +15,7 @@ def setup():
 
 def test_delete_points():
     # delete point by filter (has_id)
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/delete',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -28,18 +28,16 @@ def test_delete_points():
             }
         }
     )
-    assert response.ok
 
     # quantity check if the above point id was deleted
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['vectors_count'] == 7
+    assert response['result']['vectors_count'] == 7
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/delete',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -48,13 +46,11 @@ def test_delete_points():
             "points": [1, 2, 3, 4]
         }
     )
-    assert response.ok
 
     # quantity check if the above point id was deleted
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['vectors_count'] == 3
+    assert response['result']['vectors_count'] == 3
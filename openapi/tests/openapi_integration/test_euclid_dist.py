@@ -1,28 +1,26 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 
-collection_name = 'test_collection_euclid'
+collection_name = worker_collection_name('test_collection_euclid')
 
 
 def drop_collection(collection_name='test_collection'):
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="DELETE",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
 
 def basic_collection_setup(collection_name='test_collection'):
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="DELETE",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -33,16 +31,14 @@ def basic_collection_setup(collection_name='test_collection'):
             }
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -67,7 +63,6 @@ def basic_collection_setup(collection_name='test_collection'):
             ]
         }
     )
-    assert response.ok
 
 
 @pytest.fixture(autouse=True)
@@ -78,7 +73,7 @@ def setup():
 
 
 def test_search_with_threshold():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -87,18 +82,17 @@ def test_search_with_threshold():
             "limit": 3
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 3
+    assert len(response['result']) == 3
 
-    assert response.json()['result'][0]['id'] == 2
-    assert response.json()['result'][1]['id'] == 1
-    assert response.json()['result'][2]['id'] == 3
+    assert response['result'][0]['id'] == 2
+    assert response['result'][1]['id'] == 1
+    assert response['result'][2]['id'] == 3
 
-    assert response.json()['result'][0]['score'] - 1.0 < 0.0001
-    assert response.json()['result'][1]['score'] - 1.414214 < 0.0001
-    assert response.json()['result'][2]['score'] - 2.828427 < 0.0001
+    assert response['result'][0]['score'] - 1.0 < 0.0001
+    assert response['result'][1]['score'] - 1.414214 < 0.0001
+    assert response['result'][2]['score'] - 2.828427 < 0.0001
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -109,12 +103,11 @@ def test_search_with_threshold():
         }
     )
 
-    assert response.ok
-    assert len(response.json()['result']) == 2
+    assert len(response['result']) == 2
 
-    assert response.json()['result'][0]['id'] == 2
-    assert response.json()['result'][1]['id'] == 1
+    assert response['result'][0]['id'] == 2
+    assert response['result'][1]['id'] == 1
 
-    assert response.json()['result'][0]['score'] - 1.0 < 0.0001
-    assert response.json()['result'][1]['score'] - 1.414214 < 0.0001
+    assert response['result'][0]['score'] - 1.0 < 0.0001
+    assert response['result'][1]['score'] - 1.414214 < 0.0001
 
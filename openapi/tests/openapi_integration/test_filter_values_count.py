@@ -2,10 +2,10 @@ import random
 
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_filter_values_count'
+collection_name = worker_collection_name('test_collection_filter_values_count')
 
 
 @pytest.fixture(autouse=True)
@@ -16,7 +16,7 @@ def setup():
 
 
 def test_filter_values_count():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -35,12 +35,10 @@ def test_filter_values_count():
             }
         }
     )
-    assert response.ok
 
-    json = response.json()
-    assert len(json['result']) == 0
+    assert len(response['result']) == 0
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -59,17 +57,15 @@ def test_filter_values_count():
             }
         }
     )
-    assert response.ok
 
-    json = response.json()
-    assert len(json['result']) == 3
+    assert len(response['result']) == 3
 
-    ids = [x['id'] for x in json['result']]
+    ids = [x['id'] for x in response['result']]
     assert 2 in ids
     assert 3 in ids
     assert 4 in ids
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -88,8 +84,6 @@ def test_filter_values_count():
             }
         }
     )
-    assert response.ok
 
-    json = response.json()
-    assert len(json['result']) == 3
-    assert json['result'][0]['id'] == 1
+    assert len(response['result']) == 3
+    assert response['result'][0]['id'] == 1
@@ -2,9 +2,9 @@ import random
 
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 
-collection_name = 'test_collection_fts'
+collection_name = worker_collection_name('test_collection_fts')
 
 texts = [
     "2430 A.D.",
@@ -149,23 +149,21 @@ texts = [
 
 
 def drop_collection(collection_name='test_collection'):
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="DELETE",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
 
 def basic_collection_setup(collection_name='test_collection', on_disk_payload=False):
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="DELETE",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -177,10 +175,9 @@ def basic_collection_setup(collection_name='test_collection', on_disk_payload=Fa
             "on_disk_payload": on_disk_payload
         }
     )
-    assert response.ok
 
     # Create index
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -193,16 +190,14 @@ def basic_collection_setup(collection_name='test_collection', on_disk_payload=Fa
             }
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -217,7 +212,6 @@ def basic_collection_setup(collection_name='test_collection', on_disk_payload=Fa
             ]
         }
     )
-    assert response.ok
 
 
 @pytest.fixture(autouse=True)
@@ -228,7 +222,7 @@ def setup():
 
 
 def test_scroll_with_prefix():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -250,10 +244,9 @@ def test_scroll_with_prefix():
         }
     )
 
-    assert response.ok
-    assert len(response.json()['result']['points']) == 3
+    assert len(response['result']['points']) == 3
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -275,6 +268,5 @@ def test_scroll_with_prefix():
         }
     )
 
-    assert response.ok
-    assert len(response.json()['result']) == 3
+    assert len(response['result']) == 3
 
@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_geo_indexing'
+collection_name = worker_collection_name('test_collection_geo_indexing')
 
 
 @pytest.fixture(autouse=True)
@@ -15,7 +15,7 @@ def setup():
 
 def test_payload_operations():
     # create payload
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -50,12 +50,11 @@ def test_payload_operations():
             ]
         }
     )
-    assert response.ok
 
     # Create geo index
     # create payload
     # Create index
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -65,11 +64,10 @@ def test_payload_operations():
             "field_schema": "geo"
         }
     )
-    assert response.ok
 
     # Delete point
     # delete point by filter (has_id)
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/delete',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -82,6 +80,5 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
 
 
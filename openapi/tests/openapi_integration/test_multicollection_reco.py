@@ -1,10 +1,10 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import request_with_validation, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_reco'
-collection_name2 = 'test_collection_reco2'
+collection_name = worker_collection_name('test_collection_reco')
+collection_name2 = worker_collection_name('test_collection_reco2')
 
 
 @pytest.fixture(autouse=True)
@@ -1,46 +1,19 @@
+import functools
+
 import pytest
-import json
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, request_batch, serialize_body, worker_collection_name
 from .helpers.collection_setup import drop_collection
 
-collection_name = 'test_collection_payload_indexing'
-
-
-def nested_payload_collection_setup(collection_name, on_disk_payload=False):
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="DELETE",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
-
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="PUT",
-        path_params={'collection_name': collection_name},
-        body={
-            "vectors": {
-                "size": 4,
-                "distance": "Dot"
-            },
-            "on_disk_payload": on_disk_payload
-        }
-    )
-    assert response.ok
+collection_name = worker_collection_name('test_collection_payload_indexing')
 
-    response = request_with_validation(
-        api='/collections/{collection_name}',
-        method="GET",
-        path_params={'collection_name': collection_name},
-    )
-    assert response.ok
 
-    response = request_with_validation(
+# Serialized once on first use, the nested payloads are large
+@functools.lru_cache(maxsize=1)
+def _nested_payload_body() -> bytes:
+    return serialize_body(
         api='/collections/{collection_name}/points',
         method="PUT",
-        path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
         body={
             "points": [
                 {
@@ -167,7 +140,35 @@ def nested_payload_collection_setup(collection_name, on_disk_payload=False):
             ]
         }
     )
-    assert response.ok
+
+
+def nested_payload_collection_setup(collection_name, on_disk_payload=False, wait=True):
+    req(
+        api='/collections/{collection_name}',
+        method="DELETE",
+        path_params={'collection_name': collection_name},
+    )
+
+    req(
+        api='/collections/{collection_name}',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        body={
+            "vectors": {
+                "size": 4,
+                "distance": "Dot"
+            },
+            "on_disk_payload": on_disk_payload
+        }
+    )
+
+    req(
+        api='/collections/{collection_name}/points',
+        method="PUT",
+        path_params={'collection_name': collection_name},
+        query_params={'wait': 'true' if wait else 'false'},
+        raw_body=_nested_payload_body()
+    )
 
 
 @pytest.fixture(autouse=True)
@@ -178,28 +179,27 @@ def setup():
 
 
 def test_payload_indexing_operations():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
     # Create nested index
-    response = request_with_validation(
+    # Updates are applied in order, waiting for the second index covers the first one
+    req(
         api='/collections/{collection_name}/index',
         method="PUT",
         path_params={'collection_name': collection_name},
-        query_params={'wait': 'true'},
+        query_params={'wait': 'false'},
         body={
             "field_name": "country.capital",
             "field_schema": "keyword"
         }
     )
-    assert response.ok
 
     # Create nested array index
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -209,157 +209,162 @@ def test_payload_indexing_operations():
             "field_schema": "float"
         }
     )
-    assert response.ok
 
     # Validate index creation
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['payload_schema']['country.capital']['data_type'] == "keyword"
-    assert response.json()['result']['payload_schema']['country.capital']['points'] == 4
-    assert response.json()['result']['payload_schema']['country.cities[].population']['data_type'] == "float"
-    assert response.json()['result']['payload_schema']['country.cities[].population']['points'] == 4 # indexed records
+    assert response['result']['payload_schema']['country.capital']['data_type'] == "keyword"
+    assert response['result']['payload_schema']['country.capital']['points'] == 4
+    assert response['result']['payload_schema']['country.cities[].population']['data_type'] == "float"
+    assert response['result']['payload_schema']['country.cities[].population']['points'] == 4 # indexed records
 
-    # Search nested through with payload index
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "should": [
-                    {
-                        "key": "country.capital",
-                        "match": {
-                            "value": "London"
+    # Searches are independent from each other, send them at the same time
+    with request_batch() as responses:
+        # Search nested through with payload index
+        req(
+            api='/collections/{collection_name}/points/scroll',
+            method="POST",
+            path_params={'collection_name': collection_name},
+            body={
+                "filter": {
+                    "should": [
+                        {
+                            "key": "country.capital",
+                            "match": {
+                                "value": "London"
+                            }
                         }
-                    }
-                ]
-            },
-            "limit": 3
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
-    assert response.json()['result']['points'][0]['payload']['country']['name'] == "England"
+                    ]
+                },
+                "limit": 3
+            }
+        )
 
-    # Search nested without payload index
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "should": [
-                    {
-                        "key": "country.name",
-                        "match": {
-                            "value": "France"
+        # Search nested without payload index
+        req(
+            api='/collections/{collection_name}/points/scroll',
+            method="POST",
+            path_params={'collection_name': collection_name},
+            body={
+                "filter": {
+                    "should": [
+                        {
+                            "key": "country.name",
+                            "match": {
+                                "value": "France"
+                            }
                         }
-                    }
-                ]
-            },
-            "limit": 3
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
-    assert response.json()['result']['points'][0]['payload']['country']['capital'] == "Paris"
+                    ]
+                },
+                "limit": 3
+            }
+        )
 
-    # Search through array without payload index
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "should": [
-                    {
-                        "key": "country.cities.population", # Do not implicitly do inside nested array
-                        "range": {
-                            "gte": 9.0,
+        # Search through array without payload index
+        req(
+            api='/collections/{collection_name}/points/scroll',
+            method="POST",
+            path_params={'collection_name': collection_name},
+            body={
+                "filter": {
+                    "should": [
+                        {
+                            "key": "country.cities.population", # Do not implicitly do inside nested array
+                            "range": {
+                                "gte": 9.0,
+                            }
                         }
-                    }
-                ]
-            },
-            "limit": 3
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 0
+                    ]
+                },
+                "limit": 3
+            }
+        )
 
-    # Search through array with payload index
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "should": [
-                    {
-                        "key": "country.cities[].population",
-                        "range": {
-                            "gte": 9.0,
+        # Search through array with payload index
+        req(
+            api='/collections/{collection_name}/points/scroll',
+            method="POST",
+            path_params={'collection_name': collection_name},
+            body={
+                "filter": {
+                    "should": [
+                        {
+                            "key": "country.cities[].population",
+                            "range": {
+                                "gte": 9.0,
+                            }
                         }
-                    }
-                ]
-            },
-            "limit": 3
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
+                    ]
+                },
+                "limit": 3
+            }
+        )
+
+        # Search through array without payload index
+        req(
+            api='/collections/{collection_name}/points/scroll',
+            method="POST",
+            path_params={'collection_name': collection_name},
+            body={
+                "filter": {
+                    "should": [
+                        {
+                            "key": "country.cities[].sightseeing",
+                            "match": {
+                                "value": "Eiffel Tower"
+                            }
+                        }
+                    ]
+                },
+                "limit": 3
+            }
+        )
+
+    london_capital, france_name, \
+        population_without_brackets, population_with_brackets, eiffel_tower_sightseeing = responses
+
+    # Search nested through with payload index
+    assert len(london_capital['result']['points']) == 1
+    assert london_capital['result']['points'][0]['payload']['country']['name'] == "England"
+
+    # Search nested without payload index
+    assert len(france_name['result']['points']) == 1
+    assert france_name['result']['points'][0]['payload']['country']['capital'] == "Paris"
+
+    # Search through array without payload index
+    assert len(population_without_brackets['result']['points']) == 0
+
+    # Search through array with payload index
+    assert len(population_with_brackets['result']['points']) == 1
     # Only Japan has a city with population greater than 9.0
-    assert response.json()['result']['points'][0]['payload']['country']['name'] == "Japan"
+    assert population_with_brackets['result']['points'][0]['payload']['country']['name'] == "Japan"
 
     # Search through array without payload index
-    response = request_with_validation(
-        api='/collections/{collection_name}/points/scroll',
-        method="POST",
-        path_params={'collection_name': collection_name},
-        body={
-            "filter": {
-                "should": [
-                    {
-                        "key": "country.cities[].sightseeing",
-                        "match": {
-                            "value": "Eiffel Tower"
-                        }
-                    }
-                ]
-            },
-            "limit": 3
-        }
-    )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 1
-    assert response.json()['result']['points'][0]['payload']['country']['capital'] == "Paris"
+    assert len(eiffel_tower_sightseeing['result']['points']) == 1
+    assert eiffel_tower_sightseeing['result']['points'][0]['payload']['country']['capital'] == "Paris"
 
-    # Delete indexes
-    response = request_with_validation(
+    # Delete indexes, waiting for the last deletion only
+    req(
         api='/collections/{collection_name}/index/{field_name}',
         method="DELETE",
         path_params={'collection_name': collection_name, 'field_name': 'country.capital'},
-        query_params={'wait': 'true'},
+        query_params={'wait': 'false'},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index/{field_name}',
         method="DELETE",
         path_params={'collection_name': collection_name, 'field_name': 'country.cities[].population'},
         query_params={'wait': 'true'},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload_schema']) == 0
+    assert len(response['result']['payload_schema']) == 0
 
@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_payload_indexing'
+collection_name = worker_collection_name('test_collection_payload_indexing')
 
 
 @pytest.fixture(autouse=True)
@@ -15,7 +15,7 @@ def setup():
 
 def test_payload_indexing_operations():
     # create payload
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -25,17 +25,15 @@ def test_payload_indexing_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
     # Create index
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -45,30 +43,26 @@ def test_payload_indexing_operations():
             "field_schema": "keyword"
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert response.json()['result']['payload_schema']['test_payload']['data_type'] == "keyword"
+    assert response['result']['payload_schema']['test_payload']['data_type'] == "keyword"
 
     # Delete index
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/index/{field_name}',
         method="DELETE",
         path_params={'collection_name': collection_name, 'field_name': 'test_payload'},
         query_params={'wait': 'true'},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload_schema']) == 0
+    assert len(response['result']['payload_schema']) == 0
 
@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_payload'
+collection_name = worker_collection_name('test_collection_payload')
 
 
 @pytest.fixture(autouse=True)
@@ -15,7 +15,7 @@ def setup():
 
 def test_payload_operations():
     # create payload
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -25,19 +25,17 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
+    assert len(response['result']['payload']) == 1
 
     # clean payload by filter
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload/clear',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -50,19 +48,17 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 0
+    assert len(response['result']['payload']) == 0
 
     # create payload
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -72,10 +68,9 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # delete payload by id
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload/delete',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -85,21 +80,19 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 0
+    assert len(response['result']['payload']) == 0
 
     #
     # test PUT vs POST of the payload - set vs overwrite
     #
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -108,18 +101,16 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 2
+    assert len(response['result']['payload']) == 2
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -128,20 +119,18 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 2
-    assert response.json()['result']['payload']["key1"] == "ccc"
-    assert response.json()['result']['payload']["key2"] == "bbb"
+    assert len(response['result']['payload']) == 2
+    assert response['result']['payload']["key1"] == "ccc"
+    assert response['result']['payload']["key2"] == "bbb"
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -150,22 +139,20 @@ def test_payload_operations():
             "points": [6]
         }
     )
-    assert response.ok
 
     # check payload
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': 6},
     )
-    assert response.ok
-    assert len(response.json()['result']['payload']) == 1
-    assert response.json()['result']['payload']["key2"] == "eee"
+    assert len(response['result']['payload']) == 1
+    assert response['result']['payload']["key2"] == "eee"
 
     #
     # Check set and update of payload by filter
     #
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -174,9 +161,8 @@ def test_payload_operations():
             "points": [1, 2, 3]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -193,10 +179,9 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 3
+    assert len(response['result']['points']) == 3
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -214,9 +199,8 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -233,10 +217,9 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 3
+    assert len(response['result']['points']) == 3
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/payload/delete',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -254,9 +237,8 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/scroll',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -273,6 +255,5 @@ def test_payload_operations():
             }
         }
     )
-    assert response.ok
-    assert len(response.json()['result']['points']) == 0
+    assert len(response['result']['points']) == 0
 
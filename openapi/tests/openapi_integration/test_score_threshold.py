@@ -1,9 +1,9 @@
 import pytest
 
 from .helpers.collection_setup import basic_collection_setup, drop_collection
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 
-collection_name = 'test_collection_threshold'
+collection_name = worker_collection_name('test_collection_threshold')
 
 
 @pytest.fixture(autouse=True)
@@ -14,7 +14,7 @@ def setup():
 
 
 def test_search_with_threshold():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -23,13 +23,12 @@ def test_search_with_threshold():
             "limit": 3
         }
     )
-    assert response.ok
-    assert len(response.json()['result']) == 3
+    assert len(response['result']) == 3
 
-    more_than_second_score = response.json()['result'][1]['score'] + 0.0001
-    less_than_second_score = response.json()['result'][1]['score'] - 0.0001
+    more_than_second_score = response['result'][1]['score'] + 0.0001
+    less_than_second_score = response['result'][1]['score'] - 0.0001
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -40,10 +39,9 @@ def test_search_with_threshold():
         }
     )
 
-    assert response.ok
-    assert len(response.json()['result']) == 1
+    assert len(response['result']) == 1
 
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}/points/search',
         method="POST",
         path_params={'collection_name': collection_name},
@@ -54,5 +52,4 @@ def test_search_with_threshold():
         }
     )
 
-    assert response.ok
-    assert len(response.json()['result']) == 2
+    assert len(response['result']) == 2
@@ -1,18 +1,8 @@
-import pytest
 from datetime import datetime, timedelta
 
 from .helpers.helpers import request_with_validation
-from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_telemetry'
-
-@pytest.fixture(autouse=True)
-def setup():
-    basic_collection_setup(collection_name=collection_name)
-    yield
-    drop_collection(collection_name=collection_name)
-
-def test_metrics():
+def test_metrics(shared_collection):
     response = request_with_validation(
         api='/metrics',
         method="GET",
@@ -25,7 +15,11 @@ def test_metrics():
     assert 'app_info{name="qdrant",version="' in response.text
     assert 'collections_total ' in response.text
 
-def test_telemetry():
+    # Other collections may exist on the server, e.g. from tests running in parallel
+    collections_total = next(line for line in response.text.splitlines() if line.startswith('collections_total '))
+    assert int(collections_total.split(' ')[1]) >= 1
+
+def test_telemetry(shared_collection):
     response = request_with_validation(
         api='/telemetry',
         method="GET",
@@ -41,6 +35,6 @@ def test_telemetry():
     assert endpoint['200']['count'] > 0
     
     last_queried = endpoint['200']['last_responded']
-    last_queried = datetime.strptime(last_queried, "%Y-%m-%dT%H:%M:%S.%f%z")
+    last_queried = datetime.fromisoformat(last_queried.replace("Z", "+00:00"))
     # Assert today
     assert last_queried.date() == datetime.now().date()
\ No newline at end of file
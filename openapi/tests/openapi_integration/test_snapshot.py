@@ -1,10 +1,10 @@
 from time import sleep
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import request_with_validation, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_snapshot'
+collection_name = worker_collection_name('test_collection_snapshot')
 
 
 @pytest.fixture(autouse=True)
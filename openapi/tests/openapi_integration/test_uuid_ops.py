@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import basic_collection_setup, drop_collection
 
-collection_name = 'test_collection_uuid'
+collection_name = worker_collection_name('test_collection_uuid')
 
 
 @pytest.fixture(autouse=True)
@@ -14,7 +14,7 @@ def setup():
 
 
 def test_uuid_operations():
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -34,11 +34,9 @@ def test_uuid_operations():
             ]
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points/{id}',
         method="GET",
         path_params={'collection_name': collection_name, 'id': "b524a3c4-c568-4383-8019-c9ca08243d6a"},
     )
-    assert response.ok
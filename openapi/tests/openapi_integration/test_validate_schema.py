@@ -1,6 +1,6 @@
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import request_with_validation, worker_collection_name
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
 # validate that malformed conditions raise a JsonSchema ValidationError
@@ -1,9 +1,9 @@
 import pytest
 
-from .helpers.helpers import request_with_validation
+from .helpers.helpers import req, worker_collection_name
 from .helpers.collection_setup import drop_collection
 
-collection_name = 'test_collection'
+collection_name = worker_collection_name('test_collection')
 
 
 @pytest.fixture(autouse=True)
@@ -14,14 +14,13 @@ def setup():
 
 
 def multivec_collection_setup(collection_name='test_collection', on_disk_payload=False):
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="DELETE",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -71,9 +70,8 @@ def multivec_collection_setup(collection_name='test_collection', on_disk_payload
             "on_disk_payload": on_disk_payload
         }
     )
-    assert response.ok
 
-    response = request_with_validation(
+    req(
         api='/collections/{collection_name}/points',
         method="PUT",
         path_params={'collection_name': collection_name},
@@ -101,18 +99,16 @@ def multivec_collection_setup(collection_name='test_collection', on_disk_payload
             ]
         }
     )
-    assert response.ok
 
 
 def test_retrieve_vector_specific_hnsw():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    config = response.json()['result']['config']
+    config = response['result']['config']
     vectors = config['params']['vectors']
     assert vectors['image']['hnsw_config']['m'] == 20
     assert 'ef_construct' not in vectors['image']['hnsw_config']
@@ -124,14 +120,13 @@ def test_retrieve_vector_specific_hnsw():
 
 
 def test_retrieve_vector_specific_quantization():
-    response = request_with_validation(
+    response = req(
         api='/collections/{collection_name}',
         method="GET",
         path_params={'collection_name': collection_name},
     )
-    assert response.ok
 
-    config = response.json()['result']['config']
+    config = response['result']['config']
     vectors = config['params']['vectors']
     assert 'quantization_config' not in vectors['image']
     assert vectors['audio']['quantization_config']['scalar']['type'] == "int8"
@@ -14,4 +14,8 @@ cd "$(dirname "$0")"
 
 trap clear_after_tests EXIT
 
-pytest -s
+# Modules use their own collections and run in parallel.
+# Tests of server-wide state (write lock, full storage snapshots) run alone afterwards.
+pytest -s -n auto --dist=loadfile \
+  --ignore=openapi_integration/test_db_lock.py --ignore=openapi_integration/test_snapshot.py
+pytest -s openapi_integration/test_db_lock.py openapi_integration/test_snapshot.py
@@ -122,11 +122,9 @@ def test_collection_shard_transfer(tmp_path: pathlib.Path):
         })
     assert_http_ok(r)
 
-    # Wait for end of shard transfer
-    wait_for_collection_shard_transfers_count(source_uri, "test_collection", 0)
-
-    # Check the number of local shard goes down by 1
-    assert check_collection_local_shards_count(source_uri, "test_collection", before_local_shard_count - 1)
+    # Wait for end of shard transfer, the number of local shard goes down by 1
+    wait_for_collection_state(source_uri, "test_collection",
+                              expected_local_shard_count=before_local_shard_count - 1, expected_shard_transfers_count=0)
     assert check_collection_local_shards_count(target_uri, "test_collection", target_before_local_shard_count + 1)
 
     # Check that 'search' returns the same results on all peers
@@ -153,11 +151,9 @@ def test_collection_shard_transfer(tmp_path: pathlib.Path):
         })
     assert_http_ok(r)
 
-    # Wait for end of shard transfer
-    wait_for_collection_shard_transfers_count(source_uri, "test_collection", 0)
-
-    # Check that the number of local shard goes back to the original value
-    assert check_collection_local_shards_count(source_uri, "test_collection", before_local_shard_count)
+    # Wait for end of shard transfer, the number of local shard goes back to the original value
+    wait_for_collection_state(source_uri, "test_collection",
+                              expected_local_shard_count=before_local_shard_count, expected_shard_transfers_count=0)
     assert check_collection_local_shards_count(target_uri, "test_collection", target_before_local_shard_count + 1)
 
     # Check that 'search' returns the same results on all peers
@@ -184,11 +180,9 @@ def test_collection_shard_transfer(tmp_path: pathlib.Path):
         })
     assert_http_ok(r)
 
-    # Wait for end of shard transfer
-    wait_for_collection_shard_transfers_count(source_uri, "test_collection", 0)
-
-    # Check that the number of local shard is still the same
-    assert check_collection_local_shards_count(source_uri, "test_collection", before_local_shard_count)
+    # Wait for end of shard transfer, the number of local shard is still the same
+    wait_for_collection_state(source_uri, "test_collection",
+                              expected_local_shard_count=before_local_shard_count, expected_shard_transfers_count=0)
     assert check_collection_local_shards_count(target_uri, "test_collection", target_before_local_shard_count + 1)
 
     # Check that 'search' returns the same results on all peers
@@ -75,7 +75,8 @@ def test_peer_snapshot_bootstrap(tmp_path: pathlib.Path):
     # Wait for new leader
     #
     # NOTE: `leader_is_reelected(3)` is not an error! It returns a stateful closure.
-    wait_for(leader_is_reelected(3), peer_api_uris[1], leader)
+    # The condition counts polls seeing the same new leader, keep them RETRY_INTERVAL_SEC apart
+    wait_for(leader_is_reelected(3), peer_api_uris[1], leader, backoff=False)
 
     # Restart killed peer
     (bootstrap_api_uri, bootstrap_uri) = start_first_peer(
@@ -1,19 +1,46 @@
 import json
 import os
+import random
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, wraps
 from subprocess import Popen
 import time
 from typing import Tuple, Callable, Dict, List, Optional
 import requests
 import socket
-from contextlib import closing
 from pathlib import Path
 import pytest
 from .assertions import assert_http_ok
 
+try:
+    import orjson
+
+    def _json(r: requests.Response):
+        return orjson.loads(r.content)
+except ImportError:
+    def _json(r: requests.Response):
+        return r.json()
+
 # Tracks processes that need to be killed at the end of the test
 processes = []
 
+# Keeps connections to peers alive across the many polling requests
+SESSION = requests.Session()
+SESSION.mount("http://", requests.adapters.HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0))
+
+# (connect, read) timeout of polling checks, a wedged peer must not stall a whole wait_for iteration
+REQUEST_TIMEOUT = (1.0, 2.0)
+
+# (connect, read) timeout of getters whose results tests use directly, a busy peer may take a while to answer
+GETTER_TIMEOUT = (1.0, 10.0)
+
+# Errors meaning the peer can not be reached (yet) - callers need to retry
+PEER_UNAVAILABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+# Queries all peers of a cluster at the same time
+_POOL = ThreadPoolExecutor(max_workers=16)
+
 
 @pytest.fixture(autouse=True)
 def every_test():
@@ -25,11 +52,41 @@ def every_test():
         p.kill()
 
 
-def get_port() -> int:
-    with closing(socket.socket(socket.AF_INET, socket.SOCK_STREAM)) as s:
-        s.bind(('', 0))
+def _reap_finished_processes():
+    processes[:] = [p for p in processes if p.poll() is None]
+
+
+# Sockets holding ports handed out by get_ports until the peer using them is spawned
+_reserved_ports: Dict[int, socket.socket] = {}
+
+
+def get_ports(n: int = 3) -> List[int]:
+    sockets = []
+    for _ in range(n):
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Options only take effect when set before bind
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        return s.getsockname()[1]
+        # SO_REUSEPORT is not available on every platform
+        if hasattr(socket, "SO_REUSEPORT"):
+            s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        s.bind(('', 0))
+        sockets.append(s)
+    ports = [s.getsockname()[1] for s in sockets]
+    _reserved_ports.update(zip(ports, sockets))
+    return ports
+
+
+def release_ports(ports: List[int]):
+    for port in ports:
+        s = _reserved_ports.pop(port, None)
+        if s is not None:
+            s.close()
+
+
+def get_port() -> int:
+    [port] = get_ports(1)
+    release_ports([port])
+    return port
 
 
 def get_env(p2p_port: int, grpc_port: int, http_port: int) -> Dict[str, str]:
@@ -46,12 +103,14 @@ def get_uri(port: int) -> str:
     return f"http://127.0.0.1:{port}"
 
 
+@lru_cache(maxsize=1)
 def assert_project_root():
     directory_path = os.getcwd()
     folder_name = os.path.basename(directory_path)
     assert folder_name == "qdrant"
 
 
+@lru_cache(maxsize=1)
 def get_qdrant_exec() -> str:
     directory_path = os.getcwd()
     qdrant_exec = directory_path + "/target/debug/qdrant"
@@ -63,50 +122,57 @@ def get_pytest_current_test_name() -> str:
     return os.environ.get('PYTEST_CURRENT_TEST').split(':')[-1].split(' ')[0]
 
 
-def init_pytest_log_folder() -> str:
-    test_name = get_pytest_current_test_name()
-    log_folder = f"consensus_test_logs/{test_name}"
-    if not os.path.exists(log_folder):
-        os.makedirs(log_folder)
+# The test name changes from test to test, so only the folder creation is cached
+@lru_cache(maxsize=None)
+def _make_log_folder(test_name: str) -> Path:
+    log_folder = Path("consensus_test_logs") / test_name
+    os.makedirs(log_folder, exist_ok=True)
     return log_folder
 
 
+def init_pytest_log_folder() -> Path:
+    return _make_log_folder(get_pytest_current_test_name())
+
+
 # Starts a peer and returns its api_uri
 def start_peer(peer_dir: Path, log_file: str, bootstrap_uri: str, port=None, extra_env=None) -> str:
     if extra_env is None:
         extra_env = {}
-    p2p_port = get_port() if port is None else port + 0
-    grpc_port = get_port() if port is None else port + 1
-    http_port = get_port() if port is None else port + 2
+    ports = get_ports(3) if port is None else [port + 0, port + 1, port + 2]
+    p2p_port, grpc_port, http_port = ports
     env = {
         **get_env(p2p_port, grpc_port, http_port),
         **extra_env
     }
-    test_log_folder = init_pytest_log_folder()
-    log_file = open(f"{test_log_folder}/{log_file}", "w")
+    log_path = init_pytest_log_folder() / log_file
     print(f"Starting follower peer with bootstrap uri {bootstrap_uri},"
           f" http: http://localhost:{http_port}/cluster, p2p: {p2p_port}")
 
     this_peer_consensus_uri = get_uri(p2p_port)
-    processes.append(
-        Popen([get_qdrant_exec(), "--bootstrap", bootstrap_uri, "--uri", this_peer_consensus_uri], env=env,
-              cwd=peer_dir, stderr=log_file))
+    _reap_finished_processes()
+    # The child keeps its own copy of the log descriptor
+    with log_path.open("w") as log_fh:
+        processes.append(
+            Popen([get_qdrant_exec(), "--bootstrap", bootstrap_uri, "--uri", this_peer_consensus_uri], env=env,
+                  cwd=peer_dir, stderr=log_fh))
+    release_ports(ports)
     return get_uri(http_port)
 
 
 # Starts a peer and returns its api_uri and p2p_uri
 def start_first_peer(peer_dir: Path, log_file: str, port=None) -> Tuple[str, str]:
-    p2p_port = get_port() if port is None else port + 0
-    grpc_port = get_port() if port is None else port + 1
-    http_port = get_port() if port is None else port + 2
+    ports = get_ports(3) if port is None else [port + 0, port + 1, port + 2]
+    p2p_port, grpc_port, http_port = ports
     env = get_env(p2p_port, grpc_port, http_port)
-    test_log_folder = init_pytest_log_folder()
-    log_file = open(f"{test_log_folder}/{log_file}", "w")
+    log_path = init_pytest_log_folder() / log_file
     bootstrap_uri = get_uri(p2p_port)
     print(f"\nStarting first peer with uri {bootstrap_uri},"
           f" http: http://localhost:{http_port}/cluster, p2p: {p2p_port}")
-    processes.append(
-        Popen([get_qdrant_exec(), "--uri", bootstrap_uri], env=env, cwd=peer_dir, stderr=log_file))
+    _reap_finished_processes()
+    with log_path.open("w") as log_fh:
+        processes.append(
+            Popen([get_qdrant_exec(), "--uri", bootstrap_uri], env=env, cwd=peer_dir, stderr=log_fh))
+    release_ports(ports)
     return get_uri(http_port), bootstrap_uri
 
 
@@ -126,6 +192,8 @@ def start_cluster(tmp_path, num_peers, port_seed=None):
 
     port = None
     # Start other peers
+    # Spawned in order, tests rely on `processes[i]` being the peer running in `peer_dirs[i]`.
+    # start_peer does not wait for the peer, so they still come up concurrently.
     for i in range(1, len(peer_dirs)):
         if port_seed is not None:
             port = port_seed + i * 100
@@ -140,7 +208,13 @@ def start_cluster(tmp_path, num_peers, port_seed=None):
 def make_peer_folder(base_path: Path, peer_number: int) -> Path:
     peer_dir = base_path / f"peer{peer_number}"
     peer_dir.mkdir()
-    shutil.copytree("config", peer_dir / "config")
+    try:
+        # config is read-only for peers, hardlinks avoid copying it for every one of them
+        shutil.copytree("config", peer_dir / "config", copy_function=os.link)
+    except OSError:
+        # e.g. tmp_path is on another device
+        shutil.rmtree(peer_dir / "config", ignore_errors=True)
+        shutil.copytree("config", peer_dir / "config")
     return peer_dir
 
 
@@ -153,19 +227,23 @@ def make_peer_folders(base_path: Path, n_peers: int) -> List[Path]:
 
 
 def get_cluster_info(peer_api_uri: str) -> dict:
-    r = requests.get(f"{peer_api_uri}/cluster")
+    r = SESSION.get(f"{peer_api_uri}/cluster", timeout=GETTER_TIMEOUT)
     assert_http_ok(r)
-    res = r.json()["result"]
+    res = _json(r)["result"]
     return res
 
 
 def print_clusters_info(peer_api_uris: [str]):
-    for uri in peer_api_uris:
+    def dump(uri: str) -> str:
         try:
             # do not crash if the peer is not online
-            print(json.dumps(get_cluster_info(uri), indent=4))
-        except requests.exceptions.ConnectionError:
-            print(f"Can't retrieve cluster info for offline peer {uri}")
+            return json.dumps(get_cluster_info(uri), indent=4)
+        except PEER_UNAVAILABLE_ERRORS:
+            return f"Can't retrieve cluster info for offline peer {uri}"
+
+    # Fetched from all peers at once, printed in peer order
+    for info in _POOL.map(dump, peer_api_uris):
+        print(info)
 
 
 def fetch_highest_peer_id(peer_api_uris: [str]) -> str:
@@ -178,22 +256,22 @@ def fetch_highest_peer_id(peer_api_uris: [str]) -> str:
             if peer_id > max_peer_id:
                 max_peer_id = peer_id
                 max_peer_url = uri
-        except requests.exceptions.ConnectionError:
+        except PEER_UNAVAILABLE_ERRORS:
             print(f"Can't retrieve cluster info for offline peer {uri}")
     return max_peer_url
 
 
 def get_collection_cluster_info(peer_api_uri: str, collection_name: str) -> dict:
-    r = requests.get(f"{peer_api_uri}/collections/{collection_name}/cluster")
+    r = SESSION.get(f"{peer_api_uri}/collections/{collection_name}/cluster", timeout=GETTER_TIMEOUT)
     assert_http_ok(r)
-    res = r.json()["result"]
+    res = _json(r)["result"]
     return res
 
 
 def get_collection_info(peer_api_uri: str, collection_name: str) -> dict:
-    r = requests.get(f"{peer_api_uri}/collections/{collection_name}")
+    r = SESSION.get(f"{peer_api_uri}/collections/{collection_name}", timeout=GETTER_TIMEOUT)
     assert_http_ok(r)
-    res = r.json()["result"]
+    res = _json(r)["result"]
     return res
 
 
@@ -202,21 +280,21 @@ def print_collection_cluster_info(peer_api_uri: str, collection_name: str):
 
 
 def get_leader(peer_api_uri: str) -> str:
-    r = requests.get(f"{peer_api_uri}/cluster")
+    r = SESSION.get(f"{peer_api_uri}/cluster", timeout=GETTER_TIMEOUT)
     assert_http_ok(r)
-    return r.json()["result"]["raft_info"]["leader"]
+    return _json(r)["result"]["raft_info"]["leader"]
 
 
 def check_leader(peer_api_uri: str, expected_leader: str) -> bool:
     try:
-        r = requests.get(f"{peer_api_uri}/cluster")
+        r = SESSION.get(f"{peer_api_uri}/cluster", timeout=REQUEST_TIMEOUT)
         assert_http_ok(r)
-        leader = r.json()["result"]["raft_info"]["leader"]
+        leader = _json(r)["result"]["raft_info"]["leader"]
         correct_leader = leader == expected_leader
         if not correct_leader:
             print(f"Cluster leader invalid for peer {peer_api_uri} {leader}/{expected_leader}")
         return correct_leader
-    except requests.exceptions.ConnectionError:
+    except PEER_UNAVAILABLE_ERRORS:
         # the api is not yet available - caller needs to retry
         print(f"Could not contact peer {peer_api_uri} to fetch cluster leader")
         return False
@@ -224,11 +302,11 @@ def check_leader(peer_api_uri: str, expected_leader: str) -> bool:
 
 def leader_is_defined(peer_api_uri: str) -> bool:
     try:
-        r = requests.get(f"{peer_api_uri}/cluster")
+        r = SESSION.get(f"{peer_api_uri}/cluster", timeout=REQUEST_TIMEOUT)
         assert_http_ok(r)
-        leader = r.json()["result"]["raft_info"]["leader"]
+        leader = _json(r)["result"]["raft_info"]["leader"]
         return leader is not None
-    except requests.exceptions.ConnectionError:
+    except PEER_UNAVAILABLE_ERRORS:
         # the api is not yet available - caller needs to retry
         print(f"Could not contact peer {peer_api_uri} to fetch leader info")
         return False
@@ -236,55 +314,115 @@ def leader_is_defined(peer_api_uri: str) -> bool:
 
 def check_cluster_size(peer_api_uri: str, expected_size: int) -> bool:
     try:
-        r = requests.get(f"{peer_api_uri}/cluster")
+        r = SESSION.get(f"{peer_api_uri}/cluster", timeout=REQUEST_TIMEOUT)
         assert_http_ok(r)
-        peers = r.json()["result"]["peers"]
+        peers = _json(r)["result"]["peers"]
         correct_size = len(peers) == expected_size
         if not correct_size:
             print(f"Cluster size invalid for peer {peer_api_uri} {len(peers)}/{expected_size}")
         return correct_size
-    except requests.exceptions.ConnectionError:
+    except PEER_UNAVAILABLE_ERRORS:
         # the api is not yet available - caller needs to retry
         print(f"Could not contact peer {peer_api_uri} to fetch cluster size")
         return False
 
 
-def all_nodes_cluster_info_consistent(peer_api_uris: [str], expected_leader: str) -> bool:
-    expected_size = len(peer_api_uris)
-    for uri in peer_api_uris:
-        if check_leader(uri, expected_leader) and check_cluster_size(uri, expected_size):
-            continue
+def _fetch_cluster(peer_api_uri: str) -> Tuple[Optional[str], int]:
+    # Leader and cluster size from a single request
+    r = SESSION.get(f"{peer_api_uri}/cluster", timeout=REQUEST_TIMEOUT)
+    assert_http_ok(r)
+    result = _json(r)["result"]
+    return result["raft_info"]["leader"], len(result["peers"])
+
+
+# Within a single wait, peers that passed a check this recently are not asked again on the next poll
+PEER_OK_TTL_SEC = 0.2
+
+
+def _check_all_peers(check: Callable[[str], bool], peer_api_uris: [str],
+                     last_ok: Optional[Dict[str, float]] = None) -> bool:
+    # `last_ok` maps peer uri -> time of its last successful check, it is created by the waiting
+    # function and only lives as long as that wait. Without it every peer is checked.
+    if last_ok is None:
+        last_ok = {}
+    now = time.monotonic()
+    to_check = [uri for uri in peer_api_uris if now - last_ok.get(uri, float("-inf")) >= PEER_OK_TTL_SEC]
+    results = list(_POOL.map(check, to_check))
+    for uri, ok in zip(to_check, results):
+        if ok:
+            last_ok[uri] = time.monotonic()
         else:
-            return False
-    return True
+            last_ok.pop(uri, None)
+    return all(results)
 
 
-def all_nodes_respond(peer_api_uris: [str]) -> bool:
-    for uri in peer_api_uris:
+def all_nodes_cluster_info_consistent(peer_api_uris: [str], expected_leader: str,
+                                      last_ok: Optional[Dict[str, float]] = None) -> bool:
+    expected_size = len(peer_api_uris)
+
+    def check_peer(uri: str) -> bool:
         try:
-            r = requests.get(f"{uri}/collections")
-            assert_http_ok(r)
-        except requests.exceptions.ConnectionError:
-            print(f"Could not contact peer {uri} to fetch collections")
+            leader, size = _fetch_cluster(uri)
+        except PEER_UNAVAILABLE_ERRORS:
+            # the api is not yet available - caller needs to retry
+            print(f"Could not contact peer {uri} to fetch cluster info")
             return False
-    return True
+        if leader != expected_leader:
+            print(f"Cluster leader invalid for peer {uri} {leader}/{expected_leader}")
+        if size != expected_size:
+            print(f"Cluster size invalid for peer {uri} {size}/{expected_size}")
+        return (leader, size) == (expected_leader, expected_size)
 
+    return _check_all_peers(check_peer, peer_api_uris, last_ok)
 
-def collection_exists_on_all_peers(collection_name: str, peer_api_uris: [str]) -> bool:
-    for uri in peer_api_uris:
-        r = requests.get(f"{uri}/collections")
+
+def _node_responds(uri: str) -> bool:
+    try:
+        r = SESSION.get(f"{uri}/collections", timeout=REQUEST_TIMEOUT)
         assert_http_ok(r)
-        collections = r.json()["result"]["collections"]
-        filtered_collections = [c for c in collections if c['name'] == collection_name]
-        if len(filtered_collections) == 0:
-            print(
-                f"Collection '{collection_name}' does not exist on peer {uri} found {json.dumps(collections, indent=4)}")
-            return False
-        else:
-            continue
+        return True
+    except PEER_UNAVAILABLE_ERRORS:
+        print(f"Could not contact peer {uri} to fetch collections")
+        return False
+
+
+def all_nodes_respond(peer_api_uris: [str], last_ok: Optional[Dict[str, float]] = None) -> bool:
+    return _check_all_peers(_node_responds, peer_api_uris, last_ok)
+
+
+def _collection_exists_on_peer(collection_name: str, uri: str) -> bool:
+    # Ask for the collection itself rather than scanning the whole collections list
+    try:
+        r = SESSION.get(f"{uri}/collections/{collection_name}", timeout=REQUEST_TIMEOUT)
+    except PEER_UNAVAILABLE_ERRORS:
+        print(f"Could not contact peer {uri} to fetch collection '{collection_name}'")
+        return False
+    if r.status_code == 404:
+        print(f"Collection '{collection_name}' does not exist on peer {uri}")
+        return False
+    assert_http_ok(r)
     return True
 
 
+def collection_exists_on_all_peers(collection_name: str, peer_api_uris: [str],
+                                   last_ok: Optional[Dict[str, float]] = None) -> bool:
+    return _check_all_peers(lambda uri: _collection_exists_on_peer(collection_name, uri), peer_api_uris, last_ok)
+
+
+def _false_if_peer_unavailable(check: Callable[..., bool]) -> Callable[..., bool]:
+    # Lets wait_for retry a check when the peer did not answer in time
+    @wraps(check)
+    def wrapper(peer_api_uri: str, *args, **kwargs) -> bool:
+        try:
+            return check(peer_api_uri, *args, **kwargs)
+        except PEER_UNAVAILABLE_ERRORS:
+            print(f"Could not contact peer {peer_api_uri} for {check.__name__}")
+            return False
+
+    return wrapper
+
+
+@_false_if_peer_unavailable
 def check_collection_local_shards_count(peer_api_uri: str, collection_name: str,
                                         expected_local_shard_count: int) -> bool:
     collection_cluster_info = get_collection_cluster_info(peer_api_uri, collection_name)
@@ -292,6 +430,7 @@ def check_collection_local_shards_count(peer_api_uri: str, collection_name: str,
     return local_shard_count == expected_local_shard_count
 
 
+@_false_if_peer_unavailable
 def check_collection_shard_transfers_count(peer_api_uri: str, collection_name: str,
                                            expected_shard_transfers_count: int) -> bool:
     collection_cluster_info = get_collection_cluster_info(peer_api_uri, collection_name)
@@ -299,7 +438,22 @@ def check_collection_shard_transfers_count(peer_api_uri: str, collection_name: s
     return local_shard_count == expected_shard_transfers_count
 
 
-def check_all_replicas_active(peer_api_uri: str, collection_name: str) -> bool:
+def _collection_state(peer_api_uri: str, collection_name: str) -> Tuple[int, int]:
+    # Local shards and shard transfers counts from a single request
+    collection_cluster_info = get_collection_cluster_info(peer_api_uri, collection_name)
+    return len(collection_cluster_info["local_shards"]), len(collection_cluster_info["shard_transfers"])
+
+
+@_false_if_peer_unavailable
+def check_collection_state(peer_api_uri: str, collection_name: str,
+                           expected_local_shard_count: Optional[int] = None,
+                           expected_shard_transfers_count: Optional[int] = None) -> bool:
+    local_shard_count, shard_transfers_count = _collection_state(peer_api_uri, collection_name)
+    return (expected_local_shard_count is None or local_shard_count == expected_local_shard_count) and \
+        (expected_shard_transfers_count is None or shard_transfers_count == expected_shard_transfers_count)
+
+
+def _all_replicas_active(peer_api_uri: str, collection_name: str) -> bool:
     collection_cluster_info = get_collection_cluster_info(peer_api_uri, collection_name)
     for shard in collection_cluster_info["local_shards"]:
         if shard['state'] != 'Active':
@@ -310,23 +464,32 @@ def check_all_replicas_active(peer_api_uri: str, collection_name: str) -> bool:
     return True
 
 
+@_false_if_peer_unavailable
+def check_all_replicas_active(peer_api_uri: str, collection_name: str) -> bool:
+    return _all_replicas_active(peer_api_uri, collection_name)
+
+
+@_false_if_peer_unavailable
 def check_some_replicas_not_active(peer_api_uri: str, collection_name: str) -> bool:
-    return not check_all_replicas_active(peer_api_uri, collection_name)
+    # Not derived from check_all_replicas_active, an unavailable peer must not count as "not active"
+    return not _all_replicas_active(peer_api_uri, collection_name)
 
 
 def check_collection_cluster(peer_url, collection_name):
-    res = requests.get(f"{peer_url}/collections/{collection_name}/cluster", timeout=10)
+    res = SESSION.get(f"{peer_url}/collections/{collection_name}/cluster", timeout=GETTER_TIMEOUT)
     assert_http_ok(res)
-    return res.json()["result"]['local_shards'][0]
+    return _json(res)["result"]['local_shards'][0]
 
 
 WAIT_TIME_SEC = 30
 RETRY_INTERVAL_SEC = 0.5
+MIN_RETRY_INTERVAL_SEC = 0.02
 
 
 def wait_peer_added(peer_api_uri: str, expected_size: int = 1) -> str:
-    wait_for(check_cluster_size, peer_api_uri, expected_size)
-    wait_for(leader_is_defined, peer_api_uri)
+    # Cheap checks on a peer that is just starting, poll them often
+    wait_for(check_cluster_size, peer_api_uri, expected_size, interval=0.05)
+    wait_for(leader_is_defined, peer_api_uri, interval=0.05)
     return get_leader(peer_api_uri)
 
 
@@ -348,7 +511,7 @@ def wait_for_all_replicas_active(peer_api_uri: str, collection_name: str):
 
 def wait_for_uniform_cluster_status(peer_api_uris: [str], expected_leader: str):
     try:
-        wait_for(all_nodes_cluster_info_consistent, peer_api_uris, expected_leader)
+        wait_for(all_nodes_cluster_info_consistent, peer_api_uris, expected_leader, {})
     except Exception as e:
         print_clusters_info(peer_api_uris)
         raise e
@@ -356,7 +519,7 @@ def wait_for_uniform_cluster_status(peer_api_uris: [str], expected_leader: str):
 
 def wait_all_peers_up(peer_api_uris: [str]):
     try:
-        wait_for(all_nodes_respond, peer_api_uris)
+        wait_for(all_nodes_respond, peer_api_uris, {})
     except Exception as e:
         print_clusters_info(peer_api_uris)
         raise e
@@ -364,7 +527,7 @@ def wait_all_peers_up(peer_api_uris: [str]):
 
 def wait_for_uniform_collection_existence(collection_name: str, peer_api_uris: [str]):
     try:
-        wait_for(collection_exists_on_all_peers, collection_name, peer_api_uris)
+        wait_for(collection_exists_on_all_peers, collection_name, peer_api_uris, {})
     except Exception as e:
         print_clusters_info(peer_api_uris)
         raise e
@@ -387,20 +550,40 @@ def wait_for_collection_local_shards_count(peer_api_uri: str, collection_name: s
         raise e
 
 
-def wait_for(condition: Callable[..., bool], *args):
+def wait_for_collection_state(peer_api_uri: str, collection_name: str,
+                              expected_local_shard_count: Optional[int] = None,
+                              expected_shard_transfers_count: Optional[int] = None):
+    try:
+        wait_for(check_collection_state, peer_api_uri, collection_name, expected_local_shard_count,
+                 expected_shard_transfers_count)
+    except Exception as e:
+        print_collection_cluster_info(peer_api_uri, collection_name)
+        raise e
+
+
+def wait_for(condition: Callable[..., bool], *args, timeout: float = WAIT_TIME_SEC,
+             interval: float = RETRY_INTERVAL_SEC, backoff: bool = True):
     start = time.time()
+    # Poll quickly at first, conditions are often satisfied within a few hundred milliseconds,
+    # then back off up to `interval` to not hammer the peers during long waits.
+    # Conditions counting consecutive polls need `backoff=False`: polls are then exactly `interval` apart.
+    delay = min(MIN_RETRY_INTERVAL_SEC, interval) if backoff else interval
     while not condition(*args):
         elapsed = time.time() - start
-        if elapsed > WAIT_TIME_SEC:
+        if elapsed > timeout:
             raise Exception(
-                f"Timeout waiting for condition {condition.__name__} to be satisfied in {WAIT_TIME_SEC} seconds")
+                f"Timeout waiting for condition {condition.__name__} to be satisfied in {timeout} seconds")
         else:
-            time.sleep(RETRY_INTERVAL_SEC)
+            if backoff:
+                time.sleep(delay + random.uniform(0, delay * 0.2))
+                delay = min(delay * 1.5, interval)
+            else:
+                time.sleep(interval)
 
 
 def peer_is_online(peer_api_uri: str) -> bool:
     try:
-        r = requests.get(f"{peer_api_uri}")
+        r = SESSION.get(f"{peer_api_uri}", timeout=REQUEST_TIMEOUT)
         return r.status_code == 200
     except:
         return False
@@ -408,12 +591,13 @@ def peer_is_online(peer_api_uri: str) -> bool:
 
 def wait_for_peer_online(peer_api_uri: str):
     try:
-        wait_for(peer_is_online, peer_api_uri)
+        wait_for(peer_is_online, peer_api_uri, interval=0.05)
     except Exception as e:
         print_clusters_info([peer_api_uri])
         raise e
 
 
+@_false_if_peer_unavailable
 def check_collection_size(peer_api_uri: str, collection_name: str, expected_size: int) -> bool:
     collection_cluster_info = get_collection_info(peer_api_uri, collection_name)
     return collection_cluster_info['points_count'] == expected_size
@@ -428,24 +612,13 @@ def wait_collection_size(peer_api_uri: str, collection_name: str, expected_size:
 
 
 def wait_collection_on_all_peers(collection_name: str, peer_api_uris: [str], max_wait=30):
-    # Check that it exists on all peers
-    while True:
-        exists = True
-        for url in peer_api_uris:
-            r = requests.get(f"{url}/collections")
-            assert_http_ok(r)
-            collections = r.json()["result"]["collections"]
-            exists &= any(collection["name"] == collection_name for collection in collections)
-        if exists:
-            break
-        else:
-            # Wait until collection is created on all peers
-            # Consensus guarantees that collection will appear on majority of peers, but not on all of them
-            # So we need to wait a bit extra time
-            time.sleep(1)
-            max_wait -= 1
-        if max_wait <= 0:
-            raise Exception("Collection was not created on all peers in time")
+    # Wait until collection is created on all peers
+    # Consensus guarantees that collection will appear on majority of peers, but not on all of them
+    # So we need to wait a bit extra time
+    try:
+        wait_for(collection_exists_on_all_peers, collection_name, peer_api_uris, {}, timeout=max_wait)
+    except Exception as e:
+        raise Exception("Collection was not created on all peers in time") from e
 
 
 def wait_collection_exists_and_active_on_all_peers(collection_name: str, peer_api_uris: [str], max_wait=30):